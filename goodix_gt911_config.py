@@ -6,42 +6,79 @@ import os
 import subprocess
 import time
 import getpass
-from typing import Dict, Any, Tuple, Optional
+import shutil
+import tempfile
+from collections import namedtuple
+from typing import Dict, Tuple, Optional
+
+# Precompiled layouts for the fixed-position fields at the start of the config:
+#  Config_Version, X/Y resolution, Touches, Module_Switch1/2, Shake_Count, Filter
+_HEADER = struct.Struct('<BHHBBBBB')
+#  Single 16-bit little-endian field (X/Y resolution)
+_U16 = struct.Struct('<H')
+
+# Zeroed 186-byte config skeleton with Config_Fresh (index 185) already set;
+# every generated config is a copy of this with only the header fields patched
+_TEMPLATE_186 = bytes(185) + b'\x01'
+
+# Generator settings, in generate_goodix_config() argument order
+Settings = namedtuple(
+    'Settings',
+    'x_max y_max touch_threshold num_touch_points filter_coefficient'
+)
 
 # Configuration presets for common displays
 PRESETS = {
-    '7inch': {
-        'x_max': 1024,
-        'y_max': 600,
-        'touch_threshold': 16,
-        'num_touch_points': 5,
-        'filter_coefficient': 4
-    },
-    '5inch': {
-        'x_max': 800,
-        'y_max': 480,
-        'touch_threshold': 20,
-        'num_touch_points': 5,
-        'filter_coefficient': 4
-    },
-    'waveshare7': {
-        'x_max': 1280,
-        'y_max': 800,
-        'touch_threshold': 28,
-        'num_touch_points': 5,
-        'filter_coefficient': 4
-    }
+    '7inch': Settings(
+        x_max=1024,
+        y_max=600,
+        touch_threshold=16,
+        num_touch_points=5,
+        filter_coefficient=4
+    ),
+    '5inch': Settings(
+        x_max=800,
+        y_max=480,
+        touch_threshold=20,
+        num_touch_points=5,
+        filter_coefficient=4
+    ),
+    'waveshare7': Settings(
+        x_max=1280,
+        y_max=800,
+        touch_threshold=28,
+        num_touch_points=5,
+        filter_coefficient=4
+    )
 }
 
+# Preset used at startup and as the fallback for unknown preset names
+DEFAULT_PRESET = '7inch'
+
+# Prebuilt configs keyed by Settings, filled in once generate_goodix_config is defined
+_PREBUILT: Dict[Settings, bytes] = {}
+
 
 class SudoHandler:
     """Handle sudo operations and privilege management."""
     def __init__(self):
         self._sudo_password: Optional[str] = None
-        self._sudo_timestamp = 0
+        self._sudo_timestamp: Optional[float] = None  # time.monotonic() of last success
         self._sudo_timeout = 300  # 5 minutes
+        self._sudo_keeps_ticket = True  # False if sudo asks for a password on every call
 
     def _check_sudo_access(self) -> bool:
+        # A sudo command succeeded recently; skip the probe
+        if (self._sudo_timestamp is not None
+                and time.monotonic() - self._sudo_timestamp < self._sudo_timeout):
+            return True
+        if self._probe_sudo():
+            self._sudo_timestamp = time.monotonic()
+            return True
+        return False
+
+    def _probe_sudo(self) -> bool:
+        """Return True if sudo currently runs commands without a password."""
         try:
             result = subprocess.run(
                 ['sudo', '-n', 'true'],
@@ -61,50 +98,136 @@ class SudoHandler:
             print("\nPassword prompt cancelled.")
             return None
 
-    def run_sudo_command(self, command: list, silent: bool = False) -> Tuple[bool, str]:
-        current_time = time.time()
-        
-        if not self._check_sudo_access():
-            password = self._get_sudo_password()
-            if password is None:
-                return False, "Sudo password required but not provided"
+    def _spawn(self, command: list, input_str: Optional[str] = None,
+               input_bytes: Optional[bytes] = None,
+               capture_stdout: bool = True) -> Tuple[bool, str, str]:
+        """
+        Run command with piped stdio and return (ok, stdout, stderr).
+        Pass at most one of input_str / input_bytes as the command's stdin;
+        input_bytes switches the pipes to binary mode. With
+        capture_stdout=False the command's stdout is discarded and
+        returned as ''.
+        """
+        text = input_bytes is None
+        stdin_data = (input_str or '') if text else input_bytes
+
+        proc = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=text
+        )
+        output, error = proc.communicate(input=stdin_data)
+        if not text:
+            if output:
+                output = output.decode(errors='replace')
+            error = error.decode(errors='replace')
+        return proc.returncode == 0, output or '', error
+
+    def _authenticate(self) -> Tuple[bool, str]:
+        """
+        Validate sudo credentials with 'sudo -S -v', sending only the
+        password on stdin, so later commands can run with 'sudo -n'.
+        """
+        password = self._get_sudo_password()
+        if password is None:
+            return False, "Sudo password required but not provided"
+
+        ok, _, error = self._spawn(['sudo', '-S', '-p', '', '-v'], password + '\n',
+                                   capture_stdout=False)
+        if not ok:
+            self._sudo_password = None
+            return False, error.strip()
+        return True, ""
+
+    def _run_with_password(self, command: list, silent: bool,
+                           input_bytes: Optional[bytes]) -> Tuple[bool, str, str]:
+        """
+        Fallback for sudo setups that keep no ticket (timestamp_timeout=0):
+        run the command with 'sudo -S'. input_bytes goes through a private
+        temp file that the command's stdin is redirected from, so the
+        password on sudo's stdin can never end up in the payload.
+        """
+        password = self._get_sudo_password()
+        if password is None:
+            return False, "", "Sudo password required but not provided"
+
+        if input_bytes is None:
+            return self._spawn(['sudo', '-S', '-p', ''] + command, password + '\n',
+                               capture_stdout=not silent)
+
+        tmp_name = None
+        try:
+            fd, tmp_name = tempfile.mkstemp()
+            with os.fdopen(fd, 'wb') as f:
+                f.write(input_bytes)
 
-            try:
-                proc = subprocess.Popen(
-                    ['sudo', '-S'] + command,
-                    stdin=subprocess.PIPE,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
-                output, error = proc.communicate(input=password + '\n')
-                
-                if proc.returncode == 0:
-                    self._sudo_timestamp = current_time
-                    if not silent and output:
-                        print(output.strip())
-                    return True, ""
-                else:
-                    self._sudo_password = None
-                    return False, error.strip()
-                    
-            except Exception as e:
-                return False, str(e)
-        else:
-            try:
-                result = subprocess.run(
-                    ['sudo'] + command,
-                    capture_output=True,
-                    text=True
+            return self._spawn(
+                ['sudo', '-S', '-p', '', 'sh', '-c', 'exec "$@" < "$0"', tmp_name] + command,
+                password + '\n', capture_stdout=not silent
+            )
+        finally:
+            if tmp_name is not None:
+                try:
+                    os.remove(tmp_name)
+                except OSError:
+                    pass
+
+    def run_sudo_command(self, command: list, silent: bool = False,
+                         input_bytes: Optional[bytes] = None) -> Tuple[bool, str]:
+        """
+        Run a command under sudo. If input_bytes is given it is fed to the
+        command's stdin and the pipes are opened in binary mode. The sudo
+        password never shares stdin with the command.
+        """
+        current_time = time.monotonic()
+
+        try:
+            if not self._sudo_keeps_ticket:
+                ok, output, error = self._run_with_password(command, silent, input_bytes)
+            else:
+                # Commands run non-interactively so sudo can never fall back
+                # to prompting on the terminal behind our back
+                authenticated = not self._check_sudo_access()
+                if authenticated:
+                    ok, error = self._authenticate()
+                    if not ok:
+                        return False, error
+
+                ok, output, error = self._spawn(
+                    ['sudo', '-n'] + command, input_bytes=input_bytes,
+                    capture_stdout=not silent
                 )
-                if result.returncode == 0:
-                    if not silent and result.stdout:
-                        print(result.stdout.strip())
-                    return True, ""
-                else:
-                    return False, result.stderr.strip()
-            except Exception as e:
-                return False, str(e)
+                if not ok and not authenticated and not self._probe_sudo():
+                    # sudo's own ticket expired inside our cache window (checked
+                    # with a probe, since sudo's error text is localized)
+                    self._sudo_timestamp = None
+                    ok, error = self._authenticate()
+                    if not ok:
+                        return False, error
+                    authenticated = True
+                    ok, output, error = self._spawn(
+                        ['sudo', '-n'] + command, input_bytes=input_bytes,
+                        capture_stdout=not silent
+                    )
+                if not ok and authenticated and not self._probe_sudo():
+                    # The password was just accepted but sudo -n is still
+                    # refused: sudo keeps no ticket, so pass it every time
+                    self._sudo_keeps_ticket = False
+                    ok, output, error = self._run_with_password(command, silent, input_bytes)
+        except Exception as e:
+            return False, str(e)
+
+        if not ok:
+            self._sudo_timestamp = None
+            return False, error.strip()
+
+        self._sudo_timestamp = current_time
+        # Silent calls never capture stdout, so there is nothing to strip
+        if output:
+            print(output.strip())
+        return True, ""
 
 
 # Global sudo handler instance
@@ -119,18 +242,26 @@ def validate_resolution(x_max: int, y_max: int) -> None:
         raise ValueError("Resolution values must be even numbers")
 
 
+# Set once check_system_requirements() succeeds; failures are always re-checked
+_REQS_OK = False
+
+
 def check_system_requirements() -> Tuple[bool, str]:
     """
     Checks if /lib/firmware directory exists, modprobe is installed,
     and the Goodix driver module is available. 
     If your system doesn't have the Goodix driver built, it will fail here.
+    A successful result is cached, so later calls skip the checks.
     """
+    global _REQS_OK
+    if _REQS_OK:
+        return True, "System requirements met"
+
     try:
         if not os.path.isdir('/lib/firmware'):
             return False, "Directory /lib/firmware does not exist"
         
-        result = subprocess.run(['which', 'modprobe'], capture_output=True, text=True)
-        if result.returncode != 0:
+        if shutil.which('modprobe') is None:
             return False, "modprobe command not found"
         
         # Check if 'goodix' driver is recognized by modprobe
@@ -138,6 +269,7 @@ def check_system_requirements() -> Tuple[bool, str]:
         if result.returncode != 0:
             return False, "Goodix driver module not available"
         
+        _REQS_OK = True
         return True, "System requirements met"
     except Exception as e:
         return False, f"Error checking system requirements: {str(e)}"
@@ -153,12 +285,15 @@ def generate_goodix_config(x_max: int = 1024,
       0x8047 -> index 0 ... 0x80FF -> index 184, 0x8100 -> index 185
     with an 8-bit checksum at index 184 and 0x01 at index 185.
     """
+    prebuilt = _PREBUILT.get((x_max, y_max, touch_threshold,
+                              num_touch_points, filter_coefficient))
+    if prebuilt is not None:
+        return bytearray(prebuilt)
+
     validate_resolution(x_max, y_max)
 
     # 186 bytes total: 0..183 => the main config area, 184 => checksum, 185 => config_fresh
-    config = bytearray(186)
-    for i in range(186):
-        config[i] = 0x00
+    config = bytearray(_TEMPLATE_186)
 
     # According to GT911 doc:
     #  Byte 0   => 0x8047 (Config_Version)
@@ -174,49 +309,46 @@ def generate_goodix_config(x_max: int = 1024,
     #  Byte 184 => 0x80FF (8-bit checksum)
     #  Byte 185 => 0x8100 (Config_Fresh)
 
-    # 0x8047: Config_Version
-    config[0] = 0x01  # example version
-
-    # 0x8048..49: X resolution
-    struct.pack_into('<H', config, 1, x_max)
-
-    # 0x804A..4B: Y resolution
-    struct.pack_into('<H', config, 3, y_max)
-
-    # 0x804C: Number of Touches
-    config[5] = min(max(1, num_touch_points), 10)
-
-    # 0x804D: Module_Switch1
-    #  bits: 7 = Y2Y, 6 = X2X, etc.  0x00 => no swap, no invert
-    config[6] = 0x00
-
-    # 0x804E: Module_Switch2
-    config[7] = 0x00
-
-    # 0x804F: Shake_Count
-    config[8] = 0x03
-
-    # 0x8050: Filter
-    config[9] = filter_coefficient & 0xFF
+    touches = min(max(1, num_touch_points), 10)
+    flt = filter_coefficient & 0xFF
+    threshold = max(1, touch_threshold)
+
+    # Module_Switch1 bits: 7 = Y2Y, 6 = X2X, etc.  0x00 => no swap, no invert
+    _HEADER.pack_into(
+        config, 0,
+        0x01,       # 0x8047: Config_Version (example version)
+        x_max,      # 0x8048..49: X resolution
+        y_max,      # 0x804A..4B: Y resolution
+        touches,    # 0x804C: Number of Touches
+        0x00,       # 0x804D: Module_Switch1
+        0x00,       # 0x804E: Module_Switch2
+        0x03,       # 0x804F: Shake_Count
+        flt         # 0x8050: Filter
+    )
 
     # 0x8053: Screen_Touch_Level (threshold)
     # offset to 0x8053 = 0x8053 - 0x8047 = 0x0C decimal = 12
-    config[12] = max(1, touch_threshold)
+    config[12] = threshold  # raises ValueError if above 255
 
     # (You can add more parameter writes here if needed,
-    #  e.g. noise threshold, etc.)
+    #  e.g. noise threshold, etc. -- add them to the checksum sum below too)
 
     # ----- 8-bit Checksum across bytes [0..183] -----
-    sum_8 = sum(config[0:184]) & 0xFF
+    # All other bytes in [0..183] are zero, so sum only the fields written above
+    sum_8 = (0x01 + (x_max & 0xFF) + (x_max >> 8) + (y_max & 0xFF) + (y_max >> 8)
+             + touches + 0x03 + flt + threshold) & 0xFF
     checksum_8 = ((~sum_8) + 1) & 0xFF
     config[184] = checksum_8  # 0x80FF
 
-    # ----- CONFIG_FRESH = 0x01 -----
-    config[185] = 0x01        # 0x8100
+    # ----- CONFIG_FRESH = 0x01 ----- (0x8100, preset in _TEMPLATE_186)
 
     return config
 
 
+# Configs for the presets are built once at import time and served from here
+_PREBUILT.update((cfg, bytes(generate_goodix_config(*cfg))) for cfg in PRESETS.values())
+
+
 def print_config_details(config: bytearray) -> None:
     """
     Print key details from the GT911 config array 
@@ -226,10 +358,10 @@ def print_config_details(config: bytearray) -> None:
     config_version = config[0]
 
     # Byte 1..2 => X resolution
-    x_res = struct.unpack_from('<H', config, 1)[0]
+    x_res = _U16.unpack_from(config, 1)[0]
 
     # Byte 3..4 => Y resolution
-    y_res = struct.unpack_from('<H', config, 3)[0]
+    y_res = _U16.unpack_from(config, 3)[0]
 
     # Byte 5 => Number of touches
     touches = config[5]
@@ -255,26 +387,55 @@ def print_config_details(config: bytearray) -> None:
     # Byte 185 => 0x8100 => Config_Fresh
     fresh = config[185]
 
-    print("\n=== GT911 Configuration Details (Correct Format) ===")
-    print(f" Config_Version (0x8047):       0x{config_version:02X}")
-    print(f" X Resolution (0x8048..49):     {x_res}")
-    print(f" Y Resolution (0x804A..4B):     {y_res}")
-    print(f" Touch Points (0x804C):         {touches}")
-    print(f" Module_Switch1 (0x804D):       0x{mswitch1:02X}")
-    print(f" Module_Switch2 (0x804E):       0x{mswitch2:02X}")
-    print(f" Shake_Count (0x804F):          {shake}")
-    print(f" Filter (0x8050):               {flt}")
-    print(f" Screen_Touch_Level (0x8053):   {threshold}")
-    print(f" Checksum (0x80FF):             0x{csum:02X}")
-    print(f" Config_Fresh (0x8100):         0x{fresh:02X}")
-    print("======================================================")
+    sys.stdout.write(
+        "\n=== GT911 Configuration Details (Correct Format) ===\n"
+        f" Config_Version (0x8047):       0x{config_version:02X}\n"
+        f" X Resolution (0x8048..49):     {x_res}\n"
+        f" Y Resolution (0x804A..4B):     {y_res}\n"
+        f" Touch Points (0x804C):         {touches}\n"
+        f" Module_Switch1 (0x804D):       0x{mswitch1:02X}\n"
+        f" Module_Switch2 (0x804E):       0x{mswitch2:02X}\n"
+        f" Shake_Count (0x804F):          {shake}\n"
+        f" Filter (0x8050):               {flt}\n"
+        f" Screen_Touch_Level (0x8053):   {threshold}\n"
+        f" Checksum (0x80FF):             0x{csum:02X}\n"
+        f" Config_Fresh (0x8100):         0x{fresh:02X}\n"
+        "======================================================\n"
+    )
 
 
 def save_config_file(config: bytearray, filename: str = "goodix_911_cfg.bin") -> bool:
-    """Save the configuration bytearray to a file."""
+    """
+    Save the configuration bytearray to a file. The data is written to a
+    temporary file in the same directory and renamed over the target, so an
+    interrupted save never leaves a truncated config behind. Symlinks are
+    followed and an existing file's permissions are kept. Since the file is
+    replaced rather than rewritten, its owner is not kept, hard links to it
+    are broken and the containing directory must be writable.
+    """
+    tmp_name = None
     try:
-        with open(filename, "wb") as f:
-            f.write(config)
+        # Write through symlinks and keep an existing file's mode; new files
+        # get the mode a plain open() would give them
+        target = os.path.realpath(filename)
+        try:
+            mode = os.stat(target).st_mode & 0o7777
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+
+        fd, tmp_name = tempfile.mkstemp(dir=os.path.dirname(target))
+        try:
+            os.fchmod(fd, mode)
+            data = memoryview(bytes(config))
+            while data:
+                data = data[os.write(fd, data):]
+            os.fsync(fd)  # data must be on disk before the rename is
+        finally:
+            os.close(fd)
+        os.replace(tmp_name, target)
+        tmp_name = None
         print(f"\nConfiguration saved to '{filename}' successfully.")
         return True
     except IOError as e:
@@ -283,9 +444,15 @@ def save_config_file(config: bytearray, filename: str = "goodix_911_cfg.bin") ->
     except Exception as e:
         print(f"\nUnexpected error saving configuration: {e}")
         return False
+    finally:
+        if tmp_name is not None:
+            try:
+                os.remove(tmp_name)
+            except OSError:
+                pass
 
 
-def install_config(config: bytearray, temp_file: str = "goodix_911_cfg.bin") -> bool:
+def install_config(config: bytearray) -> bool:
     """Install the configuration file to /lib/firmware with proper permissions."""
     try:
         # Check system requirements first
@@ -294,36 +461,21 @@ def install_config(config: bytearray, temp_file: str = "goodix_911_cfg.bin") ->
             print(f"\nSystem requirements not met: {message}")
             return False
 
-        # First save to temporary file
-        with open(temp_file, "wb") as f:
-            f.write(config)
-
-        # Copy file to firmware directory
-        success, error = sudo_handler.run_sudo_command(
-            ['cp', temp_file, '/lib/firmware/goodix_911_cfg.bin']
-        )
-        if not success:
-            print(f"Error copying file: {error}")
-            return False
-
-        # Set permissions
+        # Stream the config straight into the firmware file and set permissions
+        target = '/lib/firmware/goodix_911_cfg.bin'
         success, error = sudo_handler.run_sudo_command(
-            ['chmod', '644', '/lib/firmware/goodix_911_cfg.bin']
+            ['sh', '-c', f"tee {target} >/dev/null && chmod 644 {target}"],
+            silent=True, input_bytes=bytes(config)
         )
         if not success:
-            print(f"Error setting permissions: {error}")
+            print(f"Error installing configuration: {error}")
             return False
 
-        try:
-            os.remove(temp_file)
-        except OSError:
-            print("Warning: Could not remove temporary file")
-
         # Offer to reload the driver
         print("\nConfiguration installed successfully.")
         while True:
-            reload = input("Would you like to reload the goodix driver? (y/N): ").lower()
-            if reload in ['y', 'n', '']:
+            reload = input("Would you like to reload the goodix driver? (y/N): ").casefold()
+            if reload in {'y', 'n', ''}:
                 break
             print("Please enter 'y' or 'n'")
 
@@ -355,9 +507,10 @@ def install_config(config: bytearray, temp_file: str = "goodix_911_cfg.bin") ->
 
 def get_validated_input(prompt: str, min_val: int, max_val: int, current_val: int) -> int:
     """Get and validate numeric input within specified range."""
+    prompt_str = f"{prompt} ({min_val}-{max_val}) [{current_val}]: "
     while True:
         try:
-            value = input(f"{prompt} ({min_val}-{max_val}) [{current_val}]: ")
+            value = input(prompt_str)
             if not value:  # Empty input => use current value
                 return current_val
             value = int(value)
@@ -368,36 +521,40 @@ def get_validated_input(prompt: str, min_val: int, max_val: int, current_val: in
             print("Please enter a valid number")
 
 
-def load_preset(name: str) -> Dict[str, Any]:
-    """Load preset configuration values."""
-    if name not in PRESETS:
+def load_preset(name: str) -> Settings:
+    """Load preset configuration values (presets are immutable, no copy needed)."""
+    preset = PRESETS.get(name)
+    if preset is None:
         print(f"Unknown preset '{name}'. Using default values.")
-        return PRESETS['7inch']
-    return PRESETS[name].copy()
+        return PRESETS[DEFAULT_PRESET]
+    return preset
 
 
 def print_presets() -> None:
     """Print available presets and their details."""
-    print("\nAvailable Presets:")
+    lines = ["\nAvailable Presets:\n"]
     for pname, cfg in PRESETS.items():
-        print(f"\n{pname}:")
-        print(f"  Resolution:        {cfg['x_max']}x{cfg['y_max']}")
-        print(f"  Touch Threshold:   {cfg['touch_threshold']}")
-        print(f"  Number of Touches: {cfg['num_touch_points']}")
-        print(f"  Filter Coefficient:{cfg['filter_coefficient']}")
+        lines.append(
+            f"\n{pname}:\n"
+            f"  Resolution:        {cfg.x_max}x{cfg.y_max}\n"
+            f"  Touch Threshold:   {cfg.touch_threshold}\n"
+            f"  Number of Touches: {cfg.num_touch_points}\n"
+            f"  Filter Coefficient:{cfg.filter_coefficient}\n"
+        )
+    sys.stdout.write("".join(lines))
 
 
 def interactive_menu() -> None:
     """Interactive menu for generating and installing GT911 configurations."""
-    settings = PRESETS['7inch'].copy()
+    settings = PRESETS[DEFAULT_PRESET]
 
     while True:
         print("\n=== GT911 Configuration Generator ===")
         print("\nCURRENT SETTINGS:")
-        print(f"  1) Resolution:        {settings['x_max']}x{settings['y_max']}")
-        print(f"  2) Touch Threshold:   {settings['touch_threshold']}")
-        print(f"  3) Number of Touches: {settings['num_touch_points']}")
-        print(f"  4) Filter Coefficient:{settings['filter_coefficient']}")
+        print(f"  1) Resolution:        {settings.x_max}x{settings.y_max}")
+        print(f"  2) Touch Threshold:   {settings.touch_threshold}")
+        print(f"  3) Number of Touches: {settings.num_touch_points}")
+        print(f"  4) Filter Coefficient:{settings.filter_coefficient}")
 
         print("\nACTIONS:")
         print("  5) Show Available Presets")
@@ -412,24 +569,25 @@ def interactive_menu() -> None:
 
         try:
             if choice == '1':
-                settings['x_max'] = get_validated_input(
-                    "X Resolution", 2, 4094, settings['x_max']
+                x_max = get_validated_input(
+                    "X Resolution", 2, 4094, settings.x_max
                 )
-                settings['y_max'] = get_validated_input(
-                    "Y Resolution", 2, 4094, settings['y_max']
+                y_max = get_validated_input(
+                    "Y Resolution", 2, 4094, settings.y_max
                 )
+                settings = settings._replace(x_max=x_max, y_max=y_max)
             elif choice == '2':
-                settings['touch_threshold'] = get_validated_input(
-                    "Touch Threshold", 1, 255, settings['touch_threshold']
-                )
+                settings = settings._replace(touch_threshold=get_validated_input(
+                    "Touch Threshold", 1, 255, settings.touch_threshold
+                ))
             elif choice == '3':
-                settings['num_touch_points'] = get_validated_input(
-                    "Number of Touch Points", 1, 10, settings['num_touch_points']
-                )
+                settings = settings._replace(num_touch_points=get_validated_input(
+                    "Number of Touch Points", 1, 10, settings.num_touch_points
+                ))
             elif choice == '4':
-                settings['filter_coefficient'] = get_validated_input(
-                    "Filter Coefficient", 0, 15, settings['filter_coefficient']
-                )
+                settings = settings._replace(filter_coefficient=get_validated_input(
+                    "Filter Coefficient", 0, 15, settings.filter_coefficient
+                ))
             elif choice == '5':
                 print_presets()
             elif choice == '6':
@@ -437,20 +595,20 @@ def interactive_menu() -> None:
                 preset = input("\nEnter preset name: ").strip().lower()
                 settings = load_preset(preset)
             elif choice == '7':
-                config = generate_goodix_config(**settings)
+                config = generate_goodix_config(*settings)
                 filename = input("Enter filename [goodix_911_cfg.bin]: ").strip()
                 if not filename:
                     filename = "goodix_911_cfg.bin"
                 save_config_file(config, filename)
             elif choice == '8':
-                config = generate_goodix_config(**settings)
+                config = generate_goodix_config(*settings)
                 print("\nGenerating and installing configuration...")
                 if install_config(config):
                     print("Installation completed.")
                 else:
                     print("Installation failed.")
             elif choice == '9':
-                config = generate_goodix_config(**settings)
+                config = generate_goodix_config(*settings)
                 print_config_details(config)
             elif choice == '0':
                 print("\nExiting configuration generator.")